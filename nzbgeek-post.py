@@ -10,12 +10,14 @@ Version: 1.1.1
 import os
 import sys
 import json
+import math
 import requests
 import time
 import urllib3
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Tuple
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
 from urllib3.exceptions import InsecureRequestWarning
 
 # Initialize colorama for Windows color support
@@ -55,6 +57,9 @@ CATEGORIES = {
     "8": "Other"
 }
 
+# Cassette modes for recording/replaying submission traffic
+CASSETTE_MODES = ("record", "replay")
+
 
 # ==================== HELPER FUNCTIONS ====================
 
@@ -309,7 +314,220 @@ def write_log(log_file: Path, message: str):
         print_colored(f"⚠️  [WARNING] Error writing to log: {e}", Fore.YELLOW)
 
 
-def submit_nzb(nzb_file: Path, api_key: str, category: Optional[str] = None) -> Tuple[bool, str]:
+class Cassette:
+    """
+    Records submission exchanges to a JSON Lines file, or replays them
+    
+    Each line holds one exchange: file name, category, file size, HTTP
+    status, latency (seconds), success flag, the response returned by
+    submit_nzb and, when it differs, the raw HTTP body. The API key is
+    never written.
+    """
+
+    def __init__(self, mode: str, path: Path, speed: float = 1.0):
+        """
+        Args:
+            mode: "record" or "replay"
+            path: Path to cassette file
+            speed: Replay speed factor (2.0 = twice as fast, 0 = no delay)
+        """
+        self.mode = mode
+        self.path = path
+        self.speed = speed
+        self._entries: List[dict] = []
+        self._used: List[bool] = []
+        self._by_name: Dict[str, deque] = {}
+        self._pending: Set[str] = set()
+        self._next = 0
+        
+        if mode == "replay":
+            self._load()
+
+    def _load(self):
+        """Loads recorded exchanges from the cassette file"""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"line {line_number}: {e.msg} (column {e.colno})")
+                if not isinstance(entry, dict):
+                    raise ValueError(f"line {line_number}: expected a JSON object")
+                
+                if not isinstance(entry.get('file', ''), str):
+                    raise ValueError(f"line {line_number}: invalid file {entry['file']!r}")
+                if not isinstance(entry.get('success', False), bool):
+                    raise ValueError(f"line {line_number}: invalid success {entry['success']!r}")
+                
+                # A missing or null response replays as an empty response
+                response = entry.get('response')
+                if response is None:
+                    response = ''
+                if not isinstance(response, str):
+                    raise ValueError(f"line {line_number}: invalid response {response!r}")
+                entry['response'] = response
+                
+                # A missing or null latency replays without delay
+                latency = entry.get('latency') or 0
+                if isinstance(latency, bool) or not isinstance(latency, (int, float)) \
+                        or not math.isfinite(latency) or latency < 0:
+                    raise ValueError(f"line {line_number}: invalid latency {latency!r}")
+                entry['latency'] = float(latency)
+                
+                self._by_name.setdefault(entry.get('file', ''), deque()).append(len(self._entries))
+                self._entries.append(entry)
+                self._used.append(False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def set_batch(self, nzb_files: List[Path]):
+        """
+        Declares the NZB files about to be replayed
+        
+        Entries recorded for these file names are kept for them and are never
+        handed to another file by the in-order fallback.
+        
+        Args:
+            nzb_files: NZB files of the current run
+        """
+        self._pending = {nzb_file.name for nzb_file in nzb_files}
+
+    def record(self, nzb_file: Path, category: Optional[str], status: Optional[int],
+               latency: float, success: bool, response: str, body: Optional[str] = None):
+        """
+        Appends one exchange to the cassette file
+        
+        Args:
+            nzb_file: Path to submitted NZB file
+            category: Category ID
+            status: HTTP status code, or None if no response was received
+            latency: Request duration in seconds
+            success: Success flag returned by submit_nzb
+            response: Response text returned by submit_nzb
+            body: Raw HTTP response body (stored only if it differs from response)
+        """
+        try:
+            size = nzb_file.stat().st_size
+        except OSError:
+            size = None
+        
+        entry = {
+            'time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'file': nzb_file.name,
+            'category': category,
+            'size': size,
+            'status': status,
+            'latency': round(latency, 4),
+            'success': success,
+            'response': response,
+        }
+        if body is not None and body != response:
+            entry['body'] = body
+        
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + "\n")
+        except Exception as e:
+            print_colored(f"⚠️  [WARNING] Error writing to cassette: {e}", Fore.YELLOW)
+
+    def replay(self, nzb_file: Path) -> Tuple[bool, str]:
+        """
+        Returns the recorded response for an NZB file, waiting for its latency
+        
+        Entries recorded for the same file name are used first; otherwise the
+        next unused entry in recorded order is returned, skipping entries
+        recorded for files still waiting in the current batch.
+        
+        Args:
+            nzb_file: Path to NZB file being submitted
+        
+        Returns:
+            Tuple: (success: bool, response: str)
+        """
+        self._pending.discard(nzb_file.name)
+        
+        index = None
+        queue = self._by_name.get(nzb_file.name)
+        while queue:
+            candidate = queue.popleft()
+            if not self._used[candidate]:
+                index = candidate
+                break
+        
+        if index is None:
+            while self._next < len(self._entries) and self._used[self._next]:
+                self._next += 1
+            for candidate in range(self._next, len(self._entries)):
+                if not self._used[candidate] and self._entries[candidate].get('file', '') not in self._pending:
+                    index = candidate
+                    break
+            if index is None:
+                return False, "Cassette exhausted: no recorded response left"
+        
+        self._used[index] = True
+        entry = self._entries[index]
+        
+        if self.speed > 0:
+            time.sleep(entry['latency'] / self.speed)
+        
+        return entry.get('success', False), entry['response']
+
+
+def get_cassette() -> Optional[Cassette]:
+    """
+    Gets the record/replay cassette from environment variables
+    
+    Returns:
+        Cassette: Configured cassette, or None if disabled or invalid
+    """
+    mode = os.environ.get('NZBGEEK_CASSETTE_MODE', '').strip().lower()
+    if not mode:
+        return None
+    
+    if mode not in CASSETTE_MODES:
+        print()
+        print_colored(f"❌ [ERROR] Invalid cassette mode: '{mode}'", Fore.RED, Style.BRIGHT)
+        print_colored("Set 'NZBGEEK_CASSETTE_MODE' to 'record' or 'replay'", Fore.YELLOW)
+        return None
+    
+    cassette_file = os.environ.get('NZBGEEK_CASSETTE_FILE')
+    if not cassette_file:
+        print()
+        print_colored("❌ [ERROR] Cassette file not configured!", Fore.RED, Style.BRIGHT)
+        print_colored("Set the 'NZBGEEK_CASSETTE_FILE' environment variable", Fore.YELLOW)
+        return None
+    
+    # Replay speed has no effect when recording
+    speed = 1.0
+    if mode == "replay":
+        try:
+            speed = float(os.environ.get('NZBGEEK_REPLAY_SPEED', '1'))
+        except ValueError:
+            speed = -1
+        if not math.isfinite(speed) or speed < 0:
+            print()
+            print_colored("❌ [ERROR] Invalid replay speed!", Fore.RED, Style.BRIGHT)
+            print_colored("Set 'NZBGEEK_REPLAY_SPEED' to a number >= 0 (0 = no delay)", Fore.YELLOW)
+            return None
+    
+    cassette_path = Path(cassette_file)
+    
+    try:
+        if mode == "record":
+            cassette_path.parent.mkdir(parents=True, exist_ok=True)
+        return Cassette(mode, cassette_path, speed)
+    except Exception as e:
+        print()
+        print_colored(f"❌ [ERROR] Could not open cassette '{cassette_path}': {e}", Fore.RED, Style.BRIGHT)
+        return None
+
+
+def submit_nzb(nzb_file: Path, api_key: str, category: Optional[str] = None,
+               cassette: Optional[Cassette] = None) -> Tuple[bool, str]:
     """
     Submits an NZB file to NZBGeek
     
@@ -317,10 +535,19 @@ def submit_nzb(nzb_file: Path, api_key: str, category: Optional[str] = None) ->
         nzb_file: Path to NZB file
         api_key: NZBGeek API key
         category: Category ID (optional)
+        cassette: Cassette to record to or replay from (optional)
     
     Returns:
         Tuple: (success: bool, response: str)
     """
+    # Replay mode: answer from the cassette without touching the network
+    if cassette is not None and cassette.mode == "replay":
+        return cassette.replay(nzb_file)
+    
+    status = None
+    body = None
+    start = time.perf_counter()
+    
     try:
         # Prepare URL with API key
         url = f"{API_URL}?apikey={api_key}"
@@ -335,19 +562,33 @@ def submit_nzb(nzb_file: Path, api_key: str, category: Optional[str] = None) ->
             
             # Send request
             response = requests.post(url, files=files, timeout=60, verify=False)
+            status = response.status_code
+            body = response.text
             response.raise_for_status()
             
             # Return result
-            return True, response.text
+            success, result = True, response.text
             
     except requests.exceptions.RequestException as e:
-        return False, str(e)
+        success, result = False, str(e)
     except Exception as e:
-        return False, str(e)
+        success, result = False, str(e)
+    
+    # Record mode: save the exchange (error messages and bodies may echo the API key, so hide it)
+    if cassette is not None:
+        if api_key:
+            result_recorded = result.replace(api_key, "***")
+            body = body.replace(api_key, "***") if body is not None else None
+        else:
+            result_recorded = result
+        cassette.record(nzb_file, category, status, time.perf_counter() - start,
+                        success, result_recorded, body)
+    
+    return success, result
 
 
 def process_nzbs(submission_folder: Path, complete_folder: Path, log_folder: Path, 
-                 api_key: str, category: str) -> int:
+                 api_key: str, category: str, cassette: Optional[Cassette] = None) -> int:
     """
     Processes all NZB files in the submission folder
     
@@ -357,6 +598,7 @@ def process_nzbs(submission_folder: Path, complete_folder: Path, log_folder: Pat
         log_folder: Folder where logs will be saved
         api_key: NZBGeek API key
         category: Category ID
+        cassette: Cassette to record to or replay from (optional)
     
     Returns:
         int: Number of files successfully sent
@@ -365,6 +607,10 @@ def process_nzbs(submission_folder: Path, complete_folder: Path, log_folder: Pat
     today = datetime.now().strftime("%Y-%m-%d")
     log_file = log_folder / f"submit_log_{today}.txt"
     
+    # Replayed submissions were never sent, so mark them in the shared daily log
+    replaying = cassette is not None and cassette.mode == "replay"
+    log_prefix = "[REPLAY] " if replaying else ""
+    
     # Display settings
     print()
     print_separator("═", 70, Fore.MAGENTA)
@@ -384,6 +630,14 @@ def process_nzbs(submission_folder: Path, complete_folder: Path, log_folder: Pat
     print_colored("  🔖 Category:           ", Fore.CYAN, end="")
     print_colored(f"ID {category}", Fore.YELLOW, Style.BRIGHT)
     
+    if cassette is not None:
+        print_colored("  🎞️  Cassette:           ", Fore.CYAN, end="")
+        if cassette.mode == "replay":
+            print_colored(f"REPLAY {cassette.path} ({len(cassette)} entries, speed x{cassette.speed:g})",
+                          Fore.YELLOW, Style.BRIGHT)
+        else:
+            print_colored(f"RECORD {cassette.path}", Fore.YELLOW, Style.BRIGHT)
+    
     print()
     print_separator("═", 70, Fore.MAGENTA)
     print()
@@ -398,7 +652,7 @@ def process_nzbs(submission_folder: Path, complete_folder: Path, log_folder: Pat
     if not nzb_files:
         print()
         print_colored("⚠️  No NZB files found to send.", Fore.YELLOW, Style.BRIGHT)
-        write_log(log_file, "No NZB files found.")
+        write_log(log_file, log_prefix + "No NZB files found.")
         return 0
     
     # Display processing information
@@ -409,8 +663,14 @@ def process_nzbs(submission_folder: Path, complete_folder: Path, log_folder: Pat
     print_separator("─", 70, Fore.CYAN)
     print()
     
+    if replaying:
+        cassette.set_batch(nzb_files)
+        write_log(log_file, log_prefix + f"Replaying cassette: {cassette.path} "
+                  f"({len(cassette)} entries, speed x{cassette.speed:g})")
+    
     # Process each file
     success_count = 0
+    submit_time = 0.0
     
     for idx, nzb_file in enumerate(nzb_files, 1):
         print()
@@ -419,19 +679,22 @@ def process_nzbs(submission_folder: Path, complete_folder: Path, log_folder: Pat
         print_colored(nzb_file.name, Fore.WHITE, Style.BRIGHT)
         print_separator("─", 70, Fore.BLUE)
         
-        write_log(log_file, f"[{idx}/{total_files}] Sending: {nzb_file.name} (Category: {category})")
+        write_log(log_file, log_prefix + f"[{idx}/{total_files}] Sending: {nzb_file.name} (Category: {category})")
         
-        # Simulate progress bar during upload
-        print_colored("Uploading...", Fore.YELLOW)
-        for i in range(11):
-            print_progress_bar(i, 10, prefix='Progress:', suffix='', length=40)
-            time.sleep(0.05)  # Small delay for visualization
+        # Simulate progress bar during upload (skipped on replay so it doesn't skew timing)
+        if not replaying:
+            print_colored("Uploading...", Fore.YELLOW)
+            for i in range(11):
+                print_progress_bar(i, 10, prefix='Progress:', suffix='', length=40)
+                time.sleep(0.05)  # Small delay for visualization
         
         # Submit file
-        success, response = submit_nzb(nzb_file, api_key, category)
+        submit_start = time.perf_counter()
+        success, response = submit_nzb(nzb_file, api_key, category, cassette)
+        submit_time += time.perf_counter() - submit_start
         
         if success:
-            write_log(log_file, f"Response: {response}")
+            write_log(log_file, log_prefix + f"Response: {response}")
             
             # Check if submission was successful
             try:
@@ -451,26 +714,29 @@ def process_nzbs(submission_folder: Path, complete_folder: Path, log_folder: Pat
                         nzb_file.rename(destination)
                         print_colored(f"   ➜ Moved to: ", Fore.CYAN, end="")
                         print_colored(str(destination), Fore.WHITE)
-                        write_log(log_file, f"Moved to: {destination}")
+                        write_log(log_file, log_prefix + f"Moved to: {destination}")
                         success_count += 1
                         
                     except Exception as e:
                         print()
                         print_colored(f"❌ [ERROR] Failed to move file: {e}", Fore.RED, Style.BRIGHT)
-                        write_log(log_file, f"[ERROR] Failed to move file: {e}")
+                        write_log(log_file, log_prefix + f"[ERROR] Failed to move file: {e}")
                 else:
                     print()
                     print_colored(f"⚠️  Unexpected API response: {response}", Fore.YELLOW)
-                    write_log(log_file, f"[WARNING] Unexpected response: {response}")
+                    write_log(log_file, log_prefix + f"[WARNING] Unexpected response: {response}")
                     
             except json.JSONDecodeError:
                 print()
                 print_colored(f"⚠️  Could not parse response: {response}", Fore.YELLOW)
-                write_log(log_file, f"[WARNING] Non-JSON response: {response}")
+                write_log(log_file, log_prefix + f"[WARNING] Non-JSON response: {response}")
         else:
             print()
             print_colored(f"❌ [ERROR] Submission failed: {response}", Fore.RED, Style.BRIGHT)
-            write_log(log_file, f"[ERROR] Submission failed: {response}")
+            write_log(log_file, log_prefix + f"[ERROR] Submission failed: {response}")
+    
+    write_log(log_file, log_prefix + f"Processed {total_files} file(s) in {submit_time:.2f}s "
+              f"({success_count} sent)")
     
     return success_count
 
@@ -478,13 +744,25 @@ def process_nzbs(submission_folder: Path, complete_folder: Path, log_folder: Pat
 def main():
     """Main function"""
     try:
+        # Get record/replay settings once, so a replay session uses up the cassette once
+        print_header()
+        cassette = get_cassette()
+        if cassette is None and os.environ.get('NZBGEEK_CASSETTE_MODE', '').strip():
+            print()
+            print_colored("Press ENTER to exit...", Fore.CYAN)
+            input()
+            return 1
+        
         while True:
             # Display header
             print_header()
             
-            # Get settings
-            api_key = get_api_key()
-            if not api_key:
+            # Get settings (replay mode never contacts the API, so no key is needed)
+            if cassette is not None and cassette.mode == "replay":
+                api_key = os.environ.get('NZBGEEK_API_KEY', '')
+            else:
+                api_key = get_api_key()
+            if api_key is None:
                 print()
                 print_colored("Press ENTER to exit...", Fore.CYAN)
                 input()
@@ -513,7 +791,8 @@ def main():
                 complete_folder, 
                 log_folder, 
                 api_key, 
-                category
+                category,
+                cassette
             )
             
             # Display result